@@ -3,6 +3,7 @@ module github.com/Alain-L/quellog
 go 1.24.0
 
 require (
+	github.com/andybalholm/brotli v1.1.1
 	github.com/bodgit/sevenzip v1.6.1
 	github.com/evanw/esbuild v0.27.2
 	github.com/klauspost/compress v1.18.1
@@ -13,7 +14,6 @@ require (
 )
 
 require (
-	github.com/andybalholm/brotli v1.1.1 // indirect
 	github.com/bodgit/plumbing v1.3.0 // indirect
 	github.com/bodgit/windows v1.0.1 // indirect
 	github.com/hashicorp/golang-lru/v2 v2.0.7 // indirect
@@ -8,7 +8,6 @@ import (
 	"fmt"
 	"html/template"
 	"io"
-	"regexp"
 	"strings"
 	"sync"
 
@@ -30,7 +29,7 @@ type reportTemplateData struct {
 	CSS      template.CSS
 	Body     template.HTML
 	UplotJS  template.JS
-	FzstdB64 string
+	FzstdB64 template.JS
 	AppJS    template.JS
 }
 
@@ -43,50 +42,45 @@ type HTMLReportInfo struct {
 	Version     string  // quellog version for display in the report
 }
 
-// minifyCSS performs basic CSS minification.
-func minifyCSS(css string) string {
-	// Remove comments
-	css = regexp.MustCompile(`/\*.*?\*/`).ReplaceAllString(css, "")
-	// Collapse whitespace
-	css = regexp.MustCompile(`\s+`).ReplaceAllString(css, " ")
-	// Remove space around punctuation
-	css = regexp.MustCompile(`\s*([{};:,])\s*`).ReplaceAllString(css, "$1")
-	// Remove trailing semicolons before }
-	css = regexp.MustCompile(`;\s*}`).ReplaceAllString(css, "}")
-	return strings.TrimSpace(css)
+// extractBodyContent returns the index.html body markup adapted for report mode
+func extractBodyContent() string {
+	// Change header subtitle for report mode
+	return strings.Replace(web.BodyContent(),
+		"WebAssembly demo – all processing happens locally in your browser",
+		"Report generated by CLI",
+		1)
 }
 
-// extractBodyContent extracts content between <body> and <script from index.html
-func extractBodyContent(html string) string {
-	re := regexp.MustCompile(`(?s)<body>(.*?)<script`)
-	match := re.FindStringSubmatch(html)
-	if len(match) > 1 {
-		body := strings.TrimSpace(match[1])
-		// Change header subtitle for report mode
-		body = strings.Replace(body,
-			"WebAssembly demo – all processing happens locally in your browser",
-			"Report generated by CLI",
-			1)
-		return body
-	}
-	return ""
+// quotedBase64 encodes data as a double-quoted base64 JS string literal.
+// The base64 alphabet needs no JS escaping, so the literal is typed as
+// template.JS: html/template then emits it verbatim instead of running its
+// per-character string escaper, which expands every '+' and '/'.
+func quotedBase64(data []byte) template.JS {
+	var b strings.Builder
+	b.Grow(base64.StdEncoding.EncodedLen(len(data)) + 2)
+	b.WriteByte('"')
+	enc := base64.NewEncoder(base64.StdEncoding, &b)
+	enc.Write(data)
+	enc.Close()
+	b.WriteByte('"')
+	return template.JS(b.String())
 }
 
-// gzipBase64 compresses data with gzip and encodes to base64.
-func gzipBase64(data string) string {
+// gzipBase64 compresses data with gzip and encodes it as a base64 JS string.
+func gzipBase64(data string) template.JS {
 	var buf bytes.Buffer
 	gz, _ := gzip.NewWriterLevel(&buf, gzip.BestCompression)
 	gz.Write([]byte(data))
 	gz.Close()
-	return base64.StdEncoding.EncodeToString(buf.Bytes())
+	return quotedBase64(buf.Bytes())
 }
 
 // getTemplateData returns cached template data (computed once).
 func getTemplateData() *reportTemplateData {
 	tmplDataOnce.Do(func() {
 		tmplData = &reportTemplateData{
-			CSS:      template.CSS(minifyCSS(web.StylesCSS)),
-			Body:     template.HTML(extractBodyContent(web.IndexHTML)),
+			CSS:      template.CSS(web.StylesMinCSS),
+			Body:     template.HTML(extractBodyContent()),
 			UplotJS:  template.JS(web.UplotJS),
 			FzstdB64: gzipBase64(web.FzstdJS),
 			AppJS:    template.JS(web.AppBundleJS),
@@ -108,9 +102,9 @@ type templateValues struct {
 	CSS            template.CSS
 	Body           template.HTML
 	UplotJS        template.JS
-	FzstdB64       string
+	FzstdB64       template.JS
 	AppJS          template.JS
-	CompressedData string
+	CompressedData template.JS
 	Version        string
 }
 
@@ -153,7 +147,7 @@ func ExportHTML(w io.Writer, metrics analysis.AggregatedMetrics, info HTMLReport
 	}
 
 	// Encode to base64
-	compressed := base64.StdEncoding.EncodeToString(zstdBuf.Bytes())
+	compressed := quotedBase64(zstdBuf.Bytes())
 
 	// Get cached template data
 	td := getTemplateData()
@@ -6,6 +6,32 @@ import (
 	"strings"
 )
 
+// Regexes used by formatSQL, compiled once instead of on every call.
+var (
+	sqlWhitespaceRegex = regexp.MustCompile(`\s+`)
+
+	// Keywords that should start a new line (case insensitive)
+	sqlMajorKeywordRegexes = keywordRegexes(
+		"SELECT", "FROM", "WHERE", "JOIN", "INNER JOIN", "LEFT JOIN", "RIGHT JOIN",
+		"FULL JOIN", "CROSS JOIN", "ON", "GROUP BY", "HAVING", "ORDER BY",
+		"LIMIT", "OFFSET", "UNION", "INTERSECT", "EXCEPT",
+	)
+
+	// Keywords that should be indented
+	sqlIndentedKeywordRegexes = keywordRegexes("AND", "OR")
+)
+
+// keywordRegexes compiles case-insensitive patterns matching each keyword as
+// a whole word, preserving the keyword order.
+func keywordRegexes(keywords ...string) []*regexp.Regexp {
+	patterns := make([]*regexp.Regexp, len(keywords))
+	for i, keyword := range keywords {
+		// Use word boundaries to avoid matching partial words
+		patterns[i] = regexp.MustCompile(`(?i)\b` + regexp.QuoteMeta(keyword) + `\b`)
+	}
+	return patterns
+}
+
 // formatSQL formats a SQL query for better readability with basic indentation.
 // This is a simple formatter that handles common SQL keywords and basic structure.
 func formatSQL(query string) string {
@@ -15,34 +41,19 @@ func formatSQL(query string) string {
 
 	// Normalize whitespace
 	query = strings.TrimSpace(query)
-	query = regexp.MustCompile(`\s+`).ReplaceAllString(query, " ")
-
-	// Keywords that should start a new line (case insensitive)
-	majorKeywords := []string{
-		"SELECT", "FROM", "WHERE", "JOIN", "INNER JOIN", "LEFT JOIN", "RIGHT JOIN",
-		"FULL JOIN", "CROSS JOIN", "ON", "GROUP BY", "HAVING", "ORDER BY",
-		"LIMIT", "OFFSET", "UNION", "INTERSECT", "EXCEPT",
-	}
-
-	// Keywords that should be indented
-	indentedKeywords := []string{
-		"AND", "OR",
-	}
+	query = sqlWhitespaceRegex.ReplaceAllString(query, " ")
 
 	result := query
 
 	// Replace major keywords with newline + keyword
-	for _, keyword := range majorKeywords {
-		// Use word boundaries to avoid matching partial words
-		pattern := regexp.MustCompile(`(?i)\b` + regexp.QuoteMeta(keyword) + `\b`)
+	for _, pattern := range sqlMajorKeywordRegexes {
 		result = pattern.ReplaceAllStringFunc(result, func(match string) string {
 			return "\n" + match
 		})
 	}
 
 	// Replace indented keywords (AND, OR) with newline + indent + keyword
-	for _, keyword := range indentedKeywords {
-		pattern := regexp.MustCompile(`(?i)\b` + regexp.QuoteMeta(keyword) + `\b`)
+	for _, pattern := range sqlIndentedKeywordRegexes {
 		result = pattern.ReplaceAllStringFunc(result, func(match string) string {
 			return "\n  " + match
 		})
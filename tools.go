@@ -2,4 +2,7 @@
 
 package quellog
 
-import _ "github.com/evanw/esbuild/pkg/api"
+import (
+	_ "github.com/andybalholm/brotli"
+	_ "github.com/evanw/esbuild/pkg/api"
+)
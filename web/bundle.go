@@ -12,10 +12,24 @@ import (
 	"github.com/evanw/esbuild/pkg/api"
 )
 
+// build runs esbuild and exits on error.
+func build(opts api.BuildOptions) {
+	result := api.Build(opts)
+
+	if len(result.Errors) > 0 {
+		for _, err := range result.Errors {
+			fmt.Fprintf(os.Stderr, "Error: %s\n", err.Text)
+		}
+		os.Exit(1)
+	}
+
+	fmt.Printf("  %s (%d bytes)\n", opts.Outfile, len(result.OutputFiles[0].Contents))
+}
+
 func main() {
 	// Bundle ES modules into a single IIFE file (minified for embedding)
 	fmt.Println("Bundling JS modules...")
-	result := api.Build(api.BuildOptions{
+	build(api.BuildOptions{
 		EntryPoints:       []string{"web/app.js"},
 		Bundle:            true,
 		Outfile:           "web/app.bundle.js",
@@ -29,13 +43,16 @@ func main() {
 		LogLevel:          api.LogLevelInfo,
 	})
 
-	if len(result.Errors) > 0 {
-		for _, err := range result.Errors {
-			fmt.Fprintf(os.Stderr, "Error: %s\n", err.Text)
-		}
-		os.Exit(1)
-	}
+	// Minify CSS once, shared by the CLI HTML report and the standalone build
+	fmt.Println("Minifying CSS...")
+	build(api.BuildOptions{
+		EntryPoints:      []string{"web/styles.css"},
+		Outfile:          "web/styles.min.css",
+		MinifyWhitespace: true,
+		MinifySyntax:     true,
+		Write:            true,
+		LogLevel:         api.LogLevelInfo,
+	})
 
-	fmt.Printf("  web/app.bundle.js (%d bytes)\n", len(result.OutputFiles[0].Contents))
 	fmt.Println("\nDone!")
 }
@@ -3,13 +3,19 @@
 // Package web provides embedded web assets for the HTML report.
 package web
 
-import _ "embed"
+import (
+	_ "embed"
+	"regexp"
+	"strings"
+)
 
 //go:embed index.html
 var IndexHTML string
 
-//go:embed styles.css
-var StylesCSS string
+// StylesMinCSS is styles.css minified by esbuild (generated by go generate).
+//
+//go:embed styles.min.css
+var StylesMinCSS string
 
 //go:embed app.bundle.js
 var AppBundleJS string
@@ -22,3 +28,14 @@ var FzstdJS string
 
 //go:embed report.tmpl
 var ReportTmpl string
+
+var bodyRe = regexp.MustCompile(`(?s)<body>(.*?)<!-- Scripts -->`)
+
+// BodyContent returns the markup of index.html between <body> and the
+// development script tags, shared by the HTML report and the standalone build.
+func BodyContent() string {
+	if match := bodyRe.FindStringSubmatch(IndexHTML); len(match) > 1 {
+		return strings.TrimSpace(match[1])
+	}
+	return ""
+}
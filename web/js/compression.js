@@ -19,8 +19,24 @@ export async function gunzipBuffer(buffer) {
     return result;
 }
 
-// Zstd decompression using fzstd library (loaded in standalone mode)
-export function unzstd(buffer) {
+// Native zstd support in DecompressionStream (Chrome/Edge 123+)
+const hasNativeZstd = (() => {
+    try { new DecompressionStream('zstd'); return true; } catch { return false; }
+})();
+
+// Zstd decompression: native when available, otherwise the fzstd library
+// (loaded lazily by the standalone loader through window.loadFzstd)
+export async function unzstd(buffer) {
+    if (hasNativeZstd) {
+        try {
+            const stream = new Blob([buffer]).stream().pipeThrough(new DecompressionStream('zstd'));
+            return new Uint8Array(await new Response(stream).arrayBuffer());
+        } catch (err) {
+            // Native decoders cap the window size; fzstd accepts larger windows
+            if (typeof fzstd === 'undefined' && !window.loadFzstd) throw err;
+        }
+    }
+    if (typeof fzstd === 'undefined' && window.loadFzstd) await window.loadFzstd();
     if (typeof fzstd !== 'undefined') return fzstd.decompress(new Uint8Array(buffer));
     throw new Error('Zstd decompression not available');
 }
@@ -46,7 +62,7 @@ export async function decompress(buffer, name) {
     if (format === 'plain' && (lname.endsWith('.zst') || lname.endsWith('.zstd'))) format = 'zstd';
 
     if (format === 'gzip') return await gunzipBuffer(buffer);
-    if (format === 'zstd') return unzstd(buffer);
+    if (format === 'zstd') return await unzstd(buffer);
     return new Uint8Array(buffer);
 }
 
@@ -141,7 +157,7 @@ export async function extractZip(buffer) {
         if (lname.endsWith('.gz') || lname.endsWith('.gzip')) {
             content = await gunzipBuffer(content.buffer);
         } else if (lname.endsWith('.zst') || lname.endsWith('.zstd')) {
-            content = unzstd(content.buffer);
+            content = await unzstd(content.buffer);
         }
 
         files.push({ name: baseName, content });
@@ -177,7 +193,7 @@ export async function extractTar(buffer) {
             if (lname.endsWith('.gz') || lname.endsWith('.gzip')) {
                 content = await gunzipBuffer(content.buffer);
             } else if (lname.endsWith('.zst') || lname.endsWith('.zstd')) {
-                content = unzstd(content.buffer);
+                content = await unzstd(content.buffer);
             }
             files.push({ name, content });
         }
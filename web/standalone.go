@@ -1,24 +1,47 @@
 //go:build ignore
 
 // Build standalone HTML for quellog WASM viewer.
-// Run with: go run web/standalone.go
+// Run with: go run web/standalone.go [-external-wasm] [-level N | -fast]
 // Or via: make standalone
+// Requires the generated assets from 'go generate ./web/...'.
 package main
 
 import (
+	"bufio"
 	"bytes"
-	"compress/gzip"
+	"compress/flate"
+	"crypto/sha256"
 	"encoding/base64"
+	"encoding/hex"
+	"flag"
 	"fmt"
+	"io"
 	"os"
-	"os/exec"
 	"path/filepath"
-	"regexp"
+	"sort"
+	"strconv"
 	"strings"
+	"sync"
+	"time"
+
+	"github.com/Alain-L/quellog/web"
+	"github.com/andybalholm/brotli"
+	"github.com/evanw/esbuild/pkg/api"
+	"github.com/klauspost/compress/zstd"
 )
 
 var webDir string
 
+var (
+	externalWasm = flag.Bool("external-wasm", false,
+		"write the compressed WASM to "+wasmZstName+" and fetch it at load time instead of embedding it (needs HTTP serving)")
+	level = flag.Int("level", 19, "zstd level: 10+ is best compression, 6-9 better, 3-5 default, below 3 fastest")
+	fast  = flag.Bool("fast", false, "fastest compression for development builds (overrides -level)")
+)
+
+// wasmZstName is the sibling file written in -external-wasm mode.
+const wasmZstName = "quellog.wasm.zst"
+
 func init() {
 	// Find web directory relative to this script
 	exe, _ := os.Executable()
@@ -45,159 +68,156 @@ func readBinary(name string) ([]byte, error) {
 	return os.ReadFile(filepath.Join(webDir, name))
 }
 
-func minifyJS(js string) string {
-	// Remove multi-line comments
-	js = regexp.MustCompile(`/\*[\s\S]*?\*/`).ReplaceAllString(js, "")
-	// Remove single-line comments (simple approach - not in strings)
-	lines := strings.Split(js, "\n")
-	var result []string
-	for _, line := range lines {
-		if !strings.Contains(line, "`") && strings.Contains(line, "//") {
-			// Simple comment removal (not perfect but good enough for wasm_exec)
-			if idx := strings.Index(line, "//"); idx >= 0 {
-				// Check if // is inside a string (very basic check)
-				beforeComment := line[:idx]
-				singleQuotes := strings.Count(beforeComment, "'") - strings.Count(beforeComment, "\\'")
-				doubleQuotes := strings.Count(beforeComment, "\"") - strings.Count(beforeComment, "\\\"")
-				if singleQuotes%2 == 0 && doubleQuotes%2 == 0 {
-					line = line[:idx]
-				}
-			}
-		}
-		result = append(result, line)
+// minifyJS runs esbuild's transform API (already used by bundle.go) over a
+// single script.
+func minifyJS(code string) (string, error) {
+	result := api.Transform(code, api.TransformOptions{
+		Loader:            api.LoaderJS,
+		Target:            api.ES2020,
+		MinifyWhitespace:  true,
+		MinifyIdentifiers: true,
+		MinifySyntax:      true,
+	})
+	if len(result.Errors) > 0 {
+		return "", fmt.Errorf("esbuild: %s", result.Errors[0].Text)
 	}
-	return strings.Join(result, "\n")
-}
-
-func minifyCSS(css string) string {
-	// Remove comments
-	css = regexp.MustCompile(`/\*[\s\S]*?\*/`).ReplaceAllString(css, "")
-	// Collapse whitespace
-	css = regexp.MustCompile(`\s+`).ReplaceAllString(css, " ")
-	// Remove space around punctuation
-	css = regexp.MustCompile(`\s*([{};:,>~+])\s*`).ReplaceAllString(css, "$1")
-	return strings.TrimSpace(css)
+	return string(result.Code), nil
 }
 
-func gzipBase64(data string) (string, error) {
+// deflateBytes compresses data as raw DEFLATE (no gzip header or CRC),
+// decoded in the browser with DecompressionStream('deflate-raw').
+func deflateBytes(data string) ([]byte, error) {
 	var buf bytes.Buffer
-	gz, err := gzip.NewWriterLevel(&buf, gzip.BestCompression)
-	if err != nil {
-		return "", err
-	}
-	gz.Write([]byte(data))
-	gz.Close()
-	return base64.StdEncoding.EncodeToString(buf.Bytes()), nil
-}
-
-func zstdBase64File(filename string) (string, int, error) {
-	// Use external zstd command for best compression (level 19)
-	cmd := exec.Command("zstd", "-19", "-c", filename)
-	output, err := cmd.Output()
+	fw, err := flate.NewWriter(&buf, flate.BestCompression)
 	if err != nil {
-		return "", 0, fmt.Errorf("zstd command failed: %w", err)
+		return nil, err
 	}
-	return base64.StdEncoding.EncodeToString(output), len(output), nil
+	fw.Write([]byte(data))
+	fw.Close()
+	return buf.Bytes(), nil
 }
 
-func main() {
-	fmt.Println("Building standalone HTML...")
-	fmt.Printf("Working directory: %s\n", webDir)
+// Compressed payloads are cached by content hash so unchanged inputs skip
+// recompression on the next build. The cache is pruned to cacheMaxBytes,
+// dropping the least recently used entries first.
+const (
+	cacheDirName  = ".build_cache"
+	cacheMaxBytes = 64 << 20
+)
 
-	// 1. Compress WASM with zstd
-	fmt.Println("\n[1/5] Compressing WASM...")
-	wasmData, err := readBinary("quellog_tiny.wasm")
-	if err != nil {
-		fmt.Fprintf(os.Stderr, "ERROR: %v\n", err)
-		os.Exit(1)
-	}
-	wasmPath := filepath.Join(webDir, "quellog_tiny.wasm")
-	wasmB64, zstdSize, err := zstdBase64File(wasmPath)
-	if err != nil {
-		fmt.Fprintf(os.Stderr, "ERROR compressing WASM: %v\n", err)
-		os.Exit(1)
+// cachedZstd returns data compressed with enc, reusing a previous build's
+// output when available. settings must describe the encoder options, since
+// they are part of the cache key. Reports whether the cache was hit.
+func cachedZstd(enc *zstd.Encoder, settings string, data []byte) ([]byte, bool) {
+	h := sha256.New()
+	h.Write([]byte(settings))
+	h.Write([]byte{0})
+	h.Write(data)
+	path := filepath.Join(webDir, cacheDirName, hex.EncodeToString(h.Sum(nil))+".zst")
+
+	if cached, err := os.ReadFile(path); err == nil {
+		// Touch the entry so pruning keeps recently used payloads
+		now := time.Now()
+		os.Chtimes(path, now, now)
+		return cached, true
 	}
-	fmt.Printf("  quellog_tiny.wasm: %d → %d (zstd) → %d (b64)\n", len(wasmData), zstdSize, len(wasmB64))
 
-	// 2. Read and process assets
-	fmt.Println("\n[2/5] Reading assets...")
-
-	uplotJS, err := readFile("uplot.min.js")
-	if err != nil {
-		fmt.Fprintf(os.Stderr, "ERROR: %v\n", err)
-		os.Exit(1)
+	output := enc.EncodeAll(data, nil)
+	// Cache writes are best effort: a failure only costs a recompression
+	if err := os.MkdirAll(filepath.Dir(path), 0755); err == nil {
+		tmp := path + ".tmp"
+		if err := os.WriteFile(tmp, output, 0644); err == nil {
+			os.Rename(tmp, path)
+		}
 	}
-	fmt.Printf("  uplot.min.js: %d bytes\n", len(uplotJS))
+	return output, false
+}
 
-	fzstdJS, err := readFile("fzstd.min.js")
+// pruneCache removes the least recently used cache entries until the cache
+// fits in maxBytes.
+func pruneCache(maxBytes int64) {
+	dir := filepath.Join(webDir, cacheDirName)
+	entries, err := os.ReadDir(dir)
 	if err != nil {
-		fmt.Fprintf(os.Stderr, "ERROR: %v\n", err)
-		os.Exit(1)
+		return
 	}
-	fzstdB64, err := gzipBase64(fzstdJS)
-	if err != nil {
-		fmt.Fprintf(os.Stderr, "ERROR: %v\n", err)
-		os.Exit(1)
+	var files []os.FileInfo
+	for _, e := range entries {
+		if info, err := e.Info(); err == nil && info.Mode().IsRegular() {
+			files = append(files, info)
+		}
 	}
-	gzData, _ := base64.StdEncoding.DecodeString(fzstdB64)
-	fmt.Printf("  fzstd.min.js: %d → %d (gzip) → %d (b64)\n", len(fzstdJS), len(gzData), len(fzstdB64))
-
-	wasmExec, err := readFile("wasm_exec_tiny.js")
-	if err != nil {
-		fmt.Fprintf(os.Stderr, "ERROR: %v\n", err)
-		os.Exit(1)
+	sort.Slice(files, func(i, j int) bool {
+		return files[i].ModTime().After(files[j].ModTime())
+	})
+	var total int64
+	for _, f := range files {
+		total += f.Size()
+		if total > maxBytes {
+			os.Remove(filepath.Join(dir, f.Name()))
+		}
 	}
-	wasmExecMin := minifyJS(wasmExec)
-	fmt.Printf("  wasm_exec_tiny.js: %d → %d (minified)\n", len(wasmExec), len(wasmExecMin))
+}
 
-	css, err := readFile("styles.css")
-	if err != nil {
-		fmt.Fprintf(os.Stderr, "ERROR: %v\n", err)
-		os.Exit(1)
-	}
-	cssMin := minifyCSS(css)
-	fmt.Printf("  styles.css: %d → %d (minified)\n", len(css), len(cssMin))
+// loaderScript decodes the embedded payloads, runs the JS assets and starts
+// the WASM module.
+const loaderScript = `
+// Decode base64 through a data: URL, using the browser's native decoder
+// instead of a per-byte charCodeAt loop
+const b64=s=>fetch('data:;base64,'+s);
+const D=async s=>new Uint8Array(await (await b64(s)).arrayBuffer());
+
+// Native zstd in DecompressionStream makes the fzstd bootstrap unnecessary
+const hasNativeZstd=(()=>{try{new DecompressionStream('zstd');return true}catch{return false}})();
+
+// Decompress bytes with a native DecompressionStream format
+async function inflate(u8,format){
+    const r=new Response(new Blob([u8]).stream().pipeThrough(new DecompressionStream(format)));
+    return new Uint8Array(await r.arrayBuffer());
+}
 
-	appJS, err := readFile("app.bundle.js")
-	if err != nil {
-		fmt.Fprintf(os.Stderr, "ERROR: app.bundle.js not found.\n")
-		fmt.Fprintln(os.Stderr, "Run 'go generate ./web/...' first to bundle the JS modules.")
-		os.Exit(1)
-	}
-	fmt.Printf("  app.bundle.js: %d bytes (pre-bundled)\n", len(appJS))
+// Load fzstd on first use only (also used by the app for user .zst files)
+let fzstdReady=null;
+window.loadFzstd=function(){
+    return fzstdReady??=D(FZSTD_DEFLATE_B64).then(u8=>inflate(u8,'deflate-raw'))
+        .then(b=>runScript(new TextDecoder().decode(b)));
+};
 
-	// 3. Read HTML template
-	fmt.Println("\n[3/5] Reading HTML template...")
-	html, err := readFile("index.html")
-	if err != nil {
-		fmt.Fprintf(os.Stderr, "ERROR: %v\n", err)
-		os.Exit(1)
-	}
-	fmt.Printf("  index.html: %d bytes\n", len(html))
+// Decompress a zstd frame, natively when the browser supports it
+async function dzstd(u8){
+    if(hasNativeZstd)return inflate(u8,'zstd');
+    await window.loadFzstd();
+    return fzstd.decompress(u8);
+}
 
-	// 4. Build standalone
-	fmt.Println("\n[4/5] Building standalone...")
+// Run code as a top-level script element rather than through eval
+function runScript(code){
+    const s=document.createElement('script');
+    s.textContent=code;
+    document.head.appendChild(s);
+}
 
-	// Create the WASM loader script
-	loaderScript := fmt.Sprintf(`
-// Standalone loader - embedded assets
-// uPlot charting library
-%s
-
-const WASM_ZST_B64="%s";
-const FZSTD_GZ_B64="%s";
-
-// Decompress and eval fzstd
-(function(){
-    const gz=Uint8Array.from(atob(FZSTD_GZ_B64),c=>c.charCodeAt(0));
-    const ds=new DecompressionStream('gzip');
-    const w=ds.writable.getWriter();
-    w.write(gz);w.close();
-    new Response(ds.readable).text().then(eval);
-})();
+// Run each decompressed JS part as its own script, in order
+function runScripts(buf,parts){
+    const td=new TextDecoder();
+    let o=0;
+    for(const n of parts){
+        runScript(td.decode(buf.subarray(o,o+n)));
+        o+=n;
+    }
+}
 
-// TinyGo wasm_exec
-%s
+// Compile the WASM from a stream of its zstd frame. With native zstd the
+// compiler consumes function bodies while later bytes are still being
+// decompressed (or downloaded, with WASM_ZST_URL).
+async function compileWasm(zst){
+    if(hasNativeZstd){
+        const wasm=zst.pipeThrough(new DecompressionStream('zstd'));
+        return WebAssembly.compileStreaming(new Response(wasm,{headers:{'Content-Type':'application/wasm'}}));
+    }
+    const u8=new Uint8Array(await new Response(zst).arrayBuffer());
+    return WebAssembly.compile(await dzstd(u8));
+}
 
 // Initialize WASM (standalone mode)
 window.STANDALONE_MODE=true;
@@ -214,13 +234,19 @@ window.reinitWasm=async function(){
 };
 
 (async function(){
-    // Wait for fzstd to be available
-    while(typeof fzstd==='undefined')await new Promise(r=>setTimeout(r,50));
     try{
-        const wzst=Uint8Array.from(atob(WASM_ZST_B64),c=>c.charCodeAt(0));
-        const wb=fzstd.decompress(wzst);
+        // Load uPlot, wasm_exec and the app
+        runScripts(await dzstd(await D(JS_ZST_B64)),JS_PARTS);
+        let wzst;
+        if(WASM_ZST_URL){
+            const r=await fetch(WASM_ZST_URL);
+            if(!r.ok)throw new Error(WASM_ZST_URL+': HTTP '+r.status);
+            wzst=r.body;
+        }else{
+            wzst=(await b64(WASM_ZST_B64)).body;
+        }
         // Compile first, then instantiate (needed for reinitWasm to work)
-        window.wasmModule=await WebAssembly.compile(wb);
+        window.wasmModule=await compileWasm(wzst);
         const go=new Go();
         const instance=await WebAssembly.instantiate(window.wasmModule,go.importObject);
         go.run(instance);
@@ -233,18 +259,48 @@ window.reinitWasm=async function(){
         alert('WASM initialization failed: '+e.message);
     }
 })();
-`, uplotJS, wasmB64, fzstdB64, wasmExecMin)
-
-	// Extract body content from template
-	bodyRe := regexp.MustCompile(`(?s)<body>(.*?)<!-- Scripts -->`)
-	bodyMatch := bodyRe.FindStringSubmatch(html)
-	bodyContent := ""
-	if len(bodyMatch) > 1 {
-		bodyContent = strings.TrimSpace(bodyMatch[1])
+`
+
+// compressResult holds the output of one compression job.
+type compressResult struct {
+	data   []byte
+	cached bool
+	err    error
+}
+
+// label annotates size reports for payloads served from the build cache.
+func (r compressResult) label(codec string) string {
+	if r.cached {
+		return codec + ", cached"
 	}
+	return codec
+}
 
-	// Build the standalone HTML
-	standalone := fmt.Sprintf(`<!DOCTYPE html>
+// writeBase64 streams data into w as standard base64, without building the
+// encoded string in memory.
+func writeBase64(w io.Writer, data []byte) error {
+	enc := base64.NewEncoder(base64.StdEncoding, w)
+	if _, err := enc.Write(data); err != nil {
+		return err
+	}
+	return enc.Close()
+}
+
+// standalonePage holds the pieces assembled into quellog.html.
+type standalonePage struct {
+	css          string
+	body         string
+	wasmZst      []byte
+	jsZst        []byte
+	jsPartSizes  []string
+	fzstdDeflate []byte
+	wasmURL      string // when set, wasmZst is fetched from this URL instead
+}
+
+// writeTo streams the page to w, base64-encoding each payload on the fly.
+// Write errors are sticky in bufio.Writer, so checking Flush is enough.
+func (p *standalonePage) writeTo(w *bufio.Writer) error {
+	fmt.Fprintf(w, `<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
@@ -254,21 +310,210 @@ window.reinitWasm=async function(){
 </head>
 <body>%s
 <script>
-%s
-
-%s
-</script>
+// Standalone loader - embedded assets
+const WASM_ZST_URL="%s";
+const WASM_ZST_B64="`, p.css, p.body, p.wasmURL)
+	if p.wasmURL == "" {
+		writeBase64(w, p.wasmZst)
+	}
+	w.WriteString(`";
+// uPlot, TinyGo wasm_exec and app bundle, compressed as one zstd frame
+const JS_ZST_B64="`)
+	writeBase64(w, p.jsZst)
+	fmt.Fprintf(w, `";
+const JS_PARTS=[%s];
+const FZSTD_DEFLATE_B64="`, strings.Join(p.jsPartSizes, ","))
+	writeBase64(w, p.fzstdDeflate)
+	w.WriteString(`";
+` + loaderScript + `</script>
 </body>
-</html>`, cssMin, bodyContent, loaderScript, appJS)
+</html>`)
+	return w.Flush()
+}
 
-	// 5. Write output
-	fmt.Println("\n[5/5] Writing output...")
+// writeOutputs writes the page to path and, in the same pass, path.br and
+// path.zst copies that web servers can serve as-is with Content-Encoding.
+func writeOutputs(path string, page *standalonePage, zstdLevel zstd.EncoderLevel, brQuality int) error {
+	var files []*os.File
+	defer func() {
+		for _, f := range files {
+			f.Close()
+		}
+	}()
+	for _, name := range []string{path, path + ".br", path + ".zst"} {
+		f, err := os.Create(name)
+		if err != nil {
+			return err
+		}
+		files = append(files, f)
+	}
+
+	br := brotli.NewWriterOptions(files[1], brotli.WriterOptions{
+		Quality: brQuality,
+		LGWin:   24,
+	})
+	// Keep the default 8 MB window: browsers reject larger zstd windows
+	// for HTTP Content-Encoding (RFC 9659).
+	zw, err := zstd.NewWriter(files[2], zstd.WithEncoderLevel(zstdLevel))
+	if err != nil {
+		return fmt.Errorf("failed to create zstd writer: %w", err)
+	}
+	if err := page.writeTo(bufio.NewWriter(io.MultiWriter(files[0], br, zw))); err != nil {
+		return err
+	}
+	if err := br.Close(); err != nil {
+		return err
+	}
+	if err := zw.Close(); err != nil {
+		return err
+	}
+	for _, f := range files {
+		if err := f.Close(); err != nil {
+			return err
+		}
+	}
+	files = nil
+	return nil
+}
+
+func main() {
+	flag.Parse()
+	fmt.Println("Building standalone HTML...")
+	fmt.Printf("Working directory: %s\n", webDir)
+
+	// 1. Read assets
+	fmt.Println("\n[1/3] Reading assets...")
+	wasmData, err := readBinary("quellog_tiny.wasm")
+	if err != nil {
+		fmt.Fprintf(os.Stderr, "ERROR: %v\n", err)
+		os.Exit(1)
+	}
+	fmt.Printf("  quellog_tiny.wasm: %d bytes\n", len(wasmData))
+
+	// uPlot, fzstd, the app bundle and CSS are the assets embedded in the web
+	// package, so the standalone page and the CLI report ship identical copies
+	uplotJS, fzstdJS, appJS := web.UplotJS, web.FzstdJS, web.AppBundleJS
+	fmt.Printf("  uplot.min.js: %d bytes\n", len(uplotJS))
+	fmt.Printf("  fzstd.min.js: %d bytes\n", len(fzstdJS))
+
+	wasmExec, err := readFile("wasm_exec_tiny.js")
+	if err != nil {
+		fmt.Fprintf(os.Stderr, "ERROR: %v\n", err)
+		os.Exit(1)
+	}
+	wasmExecMin, err := minifyJS(wasmExec)
+	if err != nil {
+		fmt.Fprintf(os.Stderr, "ERROR minifying wasm_exec_tiny.js: %v\n", err)
+		os.Exit(1)
+	}
+	fmt.Printf("  wasm_exec_tiny.js: %d → %d (minified)\n", len(wasmExec), len(wasmExecMin))
+
+	fmt.Printf("  styles.min.css: %d bytes (pre-minified)\n", len(web.StylesMinCSS))
+	fmt.Printf("  app.bundle.js: %d bytes (pre-bundled)\n", len(appJS))
+
+	// The JS assets share most of their vocabulary, but fzstd cannot decode
+	// dictionary frames. Compress them as a single frame instead so later
+	// assets can reference matches in earlier ones; the loader splits the
+	// output back into separate scripts using the recorded byte lengths.
+	jsParts := []string{uplotJS, wasmExecMin, appJS}
+	var jsBundle []byte
+	jsPartSizes := make([]string, len(jsParts))
+	for i, part := range jsParts {
+		jsBundle = append(jsBundle, part...)
+		jsPartSizes[i] = strconv.Itoa(len(part))
+	}
+
+	// 2. Compress payloads concurrently (wall time is bounded by the WASM job)
+	fmt.Println("\n[2/3] Compressing...")
+	zstdLevel, brQuality := zstd.EncoderLevelFromZstd(*level), brotli.BestCompression
+	if *fast {
+		zstdLevel, brQuality = zstd.SpeedFastest, brotli.BestSpeed
+	}
+	zstdSettings := "level=" + zstdLevel.String()
+	fmt.Printf("  zstd level: %s\n", zstdLevel)
+	enc, err := zstd.NewWriter(nil, zstd.WithEncoderLevel(zstdLevel))
+	if err != nil {
+		fmt.Fprintf(os.Stderr, "ERROR: failed to create zstd writer: %v\n", err)
+		os.Exit(1)
+	}
+	defer enc.Close()
+	// Frame fields tailored per payload: the JS frame drops its 4-byte
+	// checksum, the WASM frame keeps it as cheap insurance for the binary.
+	// (klauspost/compress writes no dictionary ID, and the content size is
+	// required by the single-segment frames EncodeAll produces.)
+	jsEnc, err := zstd.NewWriter(nil, zstd.WithEncoderLevel(zstdLevel), zstd.WithEncoderCRC(false))
+	if err != nil {
+		fmt.Fprintf(os.Stderr, "ERROR: failed to create zstd writer: %v\n", err)
+		os.Exit(1)
+	}
+	defer jsEnc.Close()
+
+	var wasmRes, jsRes, fzstdRes compressResult
+	var wg sync.WaitGroup
+	wg.Add(3)
+	go func() {
+		defer wg.Done()
+		wasmRes.data, wasmRes.cached = cachedZstd(enc, zstdSettings, wasmData)
+	}()
+	go func() {
+		defer wg.Done()
+		jsRes.data, jsRes.cached = cachedZstd(jsEnc, zstdSettings+",crc=false", jsBundle)
+	}()
+	go func() {
+		defer wg.Done()
+		fzstdRes.data, fzstdRes.err = deflateBytes(fzstdJS)
+	}()
+	wg.Wait()
+
+	if fzstdRes.err != nil {
+		fmt.Fprintf(os.Stderr, "ERROR: %v\n", fzstdRes.err)
+		os.Exit(1)
+	}
+	b64Len := base64.StdEncoding.EncodedLen
+	fmt.Printf("  quellog_tiny.wasm: %d → %d (%s) → %d (b64)\n", len(wasmData), len(wasmRes.data), wasmRes.label("zstd"), b64Len(len(wasmRes.data)))
+	fmt.Printf("  uplot + wasm_exec + app: %d → %d (%s) → %d (b64)\n", len(jsBundle), len(jsRes.data), jsRes.label("zstd"), b64Len(len(jsRes.data)))
+	fmt.Printf("  fzstd.min.js: %d → %d (deflate) → %d (b64)\n", len(fzstdJS), len(fzstdRes.data), b64Len(len(fzstdRes.data)))
+	pruneCache(cacheMaxBytes)
+
+	page := &standalonePage{
+		css:          web.StylesMinCSS,
+		body:         web.BodyContent(),
+		wasmZst:      wasmRes.data,
+		jsZst:        jsRes.data,
+		jsPartSizes:  jsPartSizes,
+		fzstdDeflate: fzstdRes.data,
+	}
+	if *externalWasm {
+		page.wasmURL = wasmZstName
+	}
+
+	// 3. Write output
+	fmt.Println("\n[3/3] Writing output...")
 	outputPath := filepath.Join(webDir, "quellog.html")
-	if err := os.WriteFile(outputPath, []byte(standalone), 0644); err != nil {
+	if err := writeOutputs(outputPath, page, zstdLevel, brQuality); err != nil {
+		fmt.Fprintf(os.Stderr, "ERROR: %v\n", err)
+		os.Exit(1)
+	}
+	for _, name := range []string{outputPath + ".br", outputPath + ".zst"} {
+		if info, err := os.Stat(name); err == nil {
+			fmt.Printf("  %s: %d bytes (precompressed)\n", filepath.Base(name), info.Size())
+		}
+	}
+	if *externalWasm {
+		wasmOut := filepath.Join(webDir, wasmZstName)
+		if err := os.WriteFile(wasmOut, wasmRes.data, 0644); err != nil {
+			fmt.Fprintf(os.Stderr, "ERROR: %v\n", err)
+			os.Exit(1)
+		}
+		fmt.Printf("  %s: %d bytes (serve next to quellog.html)\n", wasmZstName, len(wasmRes.data))
+	}
+
+	info, err := os.Stat(outputPath)
+	if err != nil {
 		fmt.Fprintf(os.Stderr, "ERROR: %v\n", err)
 		os.Exit(1)
 	}
 
 	fmt.Printf("\n✓ Output: %s\n", outputPath)
-	fmt.Printf("✓ Size: %d bytes (%.1f KB)\n", len(standalone), float64(len(standalone))/1024)
+	fmt.Printf("✓ Size: %d bytes (%.1f KB)\n", info.Size(), float64(info.Size())/1024)
 }